@@ -5,6 +5,6 @@ from .models import User, TenantModel
 @admin.register(User)
 class UserAdmin(admin.ModelAdmin):
     list_display = ('username', 'role')
-    search_fields = ('username', 'role')
+    search_fields = ('username',)
     list_filter = ('role',)
     readonly_fields = ('date_joined', 'last_login')
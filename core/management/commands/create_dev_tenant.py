@@ -1,4 +1,5 @@
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from tenants.models import Tenant, Domain
 
 
@@ -38,20 +39,22 @@ class Command(BaseCommand):
             return
 
         try:
-            # Create the tenant
-            tenant = Tenant.objects.create(
-                name=name,
-                slug=slug,
-                plan='premium',  # Dev gets full features
-                is_active=True,
-            )
+            # Tenant and domain are committed together or not at all
+            with transaction.atomic():
+                # Create the tenant
+                tenant = Tenant.objects.create(
+                    name=name,
+                    slug=slug,
+                    plan='premium',  # Dev gets full features
+                    is_active=True,
+                )
 
-            # Create the domain
-            Domain.objects.create(
-                domain=domain,
-                tenant=tenant,
-                is_primary=True,
-            )
+                # Create the domain
+                Domain.objects.create(
+                    domain=domain,
+                    tenant=tenant,
+                    is_primary=True,
+                )
 
             self.stdout.write(
                 self.style.SUCCESS(
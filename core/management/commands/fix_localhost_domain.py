@@ -1,4 +1,5 @@
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from tenants.models import Tenant, Domain
 
 
@@ -6,40 +7,70 @@ class Command(BaseCommand):
     help = "Add localhost domain to all tenants for development"
 
     def handle(self, *args, **options):
-        tenants = Tenant.objects.all()
+        tenants = list(Tenant.objects.values_list('id', 'name'))
 
-        if not tenants.exists():
+        if not tenants:
             self.stdout.write(
                 self.style.WARNING('No tenants found. Please create one first.')
             )
             return
 
-        for tenant in tenants:
-            # Get or create domain for localhost
-            domain, created = Domain.objects.get_or_create(
-                tenant=tenant,
-                defaults={
-                    'domain': 'localhost',
-                    'is_primary': True,
-                }
+        # Tenants that already have a domain are left untouched
+        existing = set(
+            Domain.objects.values_list('tenant_id', flat=True).distinct()
+        )
+
+        with transaction.atomic():
+            Domain.objects.bulk_create(
+                [
+                    Domain(tenant_id=tenant_id, domain='localhost', is_primary=True)
+                    for tenant_id, _ in tenants
+                    if tenant_id not in existing
+                ],
+                batch_size=1000,
+                ignore_conflicts=True,
             )
-            
-            if created:
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f"✓ Created domain 'localhost' for tenant '{tenant.name}'"
-                    )
+
+        # Domain names are unique, so only one tenant can hold 'localhost';
+        # report from what was actually stored rather than what was attempted
+        localhost_owners = set(
+            Domain.objects.filter(domain='localhost')
+            .values_list('tenant_id', flat=True)
+        )
+
+        # Build the report and write it in one go
+        success = self.style.SUCCESS
+        warning = self.style.WARNING
+        error = self.style.ERROR
+        lines = []
+        failed = False
+        for tenant_id, tenant_name in tenants:
+            if tenant_id in existing:
+                lines.append(
+                    warning(f"Domain already exists for tenant '{tenant_name}'")
+                )
+            elif tenant_id in localhost_owners:
+                lines.append(
+                    success(f"✓ Created domain 'localhost' for tenant '{tenant_name}'")
                 )
             else:
-                self.stdout.write(
-                    self.style.WARNING(
-                        f"Domain already exists for tenant '{tenant.name}'"
+                failed = True
+                lines.append(
+                    error(
+                        f"Could not create domain 'localhost' for tenant "
+                        f"'{tenant_name}': already used by another tenant"
                     )
                 )
 
-        self.stdout.write(
-            self.style.SUCCESS(
-                '\n✓ All tenants configured for localhost\n'
-                'You can now access the app at: http://localhost:8001'
+        if failed:
+            lines.append(
+                warning('\nSome tenants could not be configured for localhost')
             )
-        )
+        else:
+            lines.append(
+                success(
+                    '\n✓ All tenants configured for localhost\n'
+                    'You can now access the app at: http://localhost:8001'
+                )
+            )
+        self.stdout.write('\n'.join(lines))
@@ -0,0 +1,22 @@
+# Generated by Django 5.0 on 2026-10-14 15:20
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('core', '0001_initial'),
+        # pg_trgm is created by the tenants migration
+        ('tenants', '0004_domain_domain_domain_trgm_tenant_tenant_name_trgm'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('username'), name='gin_trgm_ops'), name='core_user_username_trgm'),
+        ),
+    ]
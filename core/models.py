@@ -1,5 +1,10 @@
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
+
+# Roles with administrative access
+_ADMIN_ROLES = frozenset(('owner', 'admin'))
 
 # Custom user model
 class User(AbstractUser):
@@ -16,11 +21,20 @@ class User(AbstractUser):
     
     role = models.CharField(max_length=50, choices=ROLE_CHOICES, default='user')
     
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Trigram index matching the admin's icontains search
+            GinIndex(
+                OpClass(Upper('username'), name='gin_trgm_ops'),
+                name='core_user_username_trgm',
+            ),
+        ]
+
     def is_owner(self):
         return self.role == 'owner'
     
     def is_admin(self):
-        return self.role in ['owner', 'admin']
+        return self.role in _ADMIN_ROLES
     
     
     def __str__(self):
@@ -1,3 +1,24 @@
-from django.test import TestCase
+from io import StringIO
 
-# Create your tests here.
+from django.core.management import call_command
+from django_tenants.test.cases import TenantTestCase
+
+from tenants.models import Tenant, Domain
+
+
+class FixLocalhostDomainTests(TenantTestCase):
+    def test_reports_tenants_left_without_localhost(self):
+        # bulk_create skips schema creation, which the command doesn't need
+        Tenant.objects.bulk_create([
+            Tenant(name='Alpha', slug='alpha'),
+            Tenant(name='Beta', slug='beta'),
+        ])
+        out = StringIO()
+
+        call_command('fix_localhost_domain', stdout=out)
+
+        output = out.getvalue()
+        self.assertEqual(Domain.objects.filter(domain='localhost').count(), 1)
+        self.assertEqual(output.count("✓ Created domain 'localhost'"), 1)
+        self.assertEqual(output.count("Could not create domain 'localhost'"), 1)
+        self.assertNotIn('All tenants configured', output)
@@ -1,6 +1,10 @@
+import logging
+import os
 from pathlib import Path
 import environ
 
+logger = logging.getLogger(__name__)
+
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -10,12 +14,14 @@ env = environ.Env()
 
 env_file = BASE_DIR / '.env'
 
-# Get the file if it exists
-if env_file.exists():
-    env.read_env(env_file)
-    print(".env file loaded successfully.")
-else:
-    print(".env file not found. Using default environment variables.")
+# Get the file if it exists, once per process tree (workers inherit it)
+if os.environ.get('DJANGO_ENV_LOADED') != '1':
+    if env_file.exists():
+        env.read_env(env_file)
+        logger.debug(".env file loaded successfully.")
+    else:
+        logger.debug(".env file not found. Using default environment variables.")
+    os.environ['DJANGO_ENV_LOADED'] = '1'
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/5.2/howto/deployment/checklist/
@@ -44,7 +50,8 @@ SHARED_APPS = [
     
     # Third-party apps
     'corsheaders',
-    'whitenoise.runserver_nostatic',
+    # Only affects runserver, so leave it out outside development
+    *(['whitenoise.runserver_nostatic'] if DEBUG else []),
     
     # Default django apps
     'django.contrib.admin',
@@ -69,8 +76,9 @@ TENANT_APPS = [
 
 # Application definition
 
-INSTALLED_APPS = list (SHARED_APPS) + [
-    app for app in TENANT_APPS if app not in SHARED_APPS
+_shared_apps = set(SHARED_APPS)
+INSTALLED_APPS = list(SHARED_APPS) + [
+    app for app in TENANT_APPS if app not in _shared_apps
 ]
 
 # Middleware configuration
@@ -99,13 +107,19 @@ TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [],
-        'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
             ],
+            # Keep compiled templates in memory after the first render
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ],
         },
     },
 ]
@@ -122,6 +136,25 @@ DATABASES = {
         'PASSWORD': env('DB_PASSWORD'),
         'HOST': env('DB_HOST'),
         'PORT': env('DB_PORT'),
+        # Keep connections open between requests; set to 0 behind pgbouncer
+        'CONN_MAX_AGE': env.int('DB_CONN_MAX_AGE', default=60),
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'application_name': 'tenantss',
+            'connect_timeout': 5,
+            # Keep idle persistent connections alive through NAT/pgbouncer
+            'keepalives': 1,
+            'keepalives_idle': 30,
+            'keepalives_interval': 10,
+            'keepalives_count': 5,
+            # Timeouts in ms; 0 disables (e.g. for migrate_schemas on big tables)
+            'options': (
+                f"-c statement_timeout={env.int('DB_STATEMENT_TIMEOUT', default=20000)} "
+                f"-c lock_timeout={env.int('DB_LOCK_TIMEOUT', default=5000)} "
+                f"-c idle_in_transaction_session_timeout="
+                f"{env.int('DB_IDLE_IN_TRANSACTION_TIMEOUT', default=60000)}"
+            ),
+        },
     }
 }
 
@@ -136,9 +169,18 @@ CACHES = {
         'LOCATION': 'redis://127.0.0.1:6379/1',
         'OPTIONS': {
             'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            # Reuse pooled connections instead of reconnecting on bursts
+            'CONNECTION_POOL_KWARGS': {
+                'max_connections': 50,
+                'retry_on_timeout': True,
+            },
+            # Treat a cache outage as a miss rather than a server error
+            'IGNORE_EXCEPTIONS': True,
         }
     }
 }
+DJANGO_REDIS_IGNORE_EXCEPTIONS = True
+DJANGO_REDIS_LOG_IGNORED_EXCEPTIONS = True
 
 # REST Framework Configuration
 REST_FRAMEWORK = {
@@ -185,7 +227,16 @@ USE_TZ = True
 # Static files (CSS, JavaScript, Images)
 STATIC_URL = 'static/'
 STATIC_ROOT = BASE_DIR / 'staticfiles'
-STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    # Brotli (via the Brotli package) and gzip variants are built at collectstatic
+    'staticfiles': {
+        'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage',
+    },
+}
+WHITENOISE_MANIFEST_STRICT = True
 
 # MEDIA
 MEDIA_URL = '/media/'
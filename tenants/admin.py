@@ -11,7 +11,7 @@ class DomainInline(admin.TabularInline):
 @admin.register(Tenant)
 class TenantAdmin(admin.ModelAdmin):
     list_display = ('name', 'plan', 'is_active', 'created_at')
-    search_fields = ('name', 'plan')
+    search_fields = ('name',)
     list_filter = ('created_at', 'plan')
     readonly_fields = ('slug',)
     ordering = ('-created_at',)
@@ -22,5 +22,11 @@ class TenantAdmin(admin.ModelAdmin):
 @admin.register(Domain)
 class DomainAdmin(admin.ModelAdmin):
     list_display = ('domain', 'tenant', 'is_primary')
-    list_filter = ('tenant', 'is_primary')
-    search_fields = ('domain',)
\ No newline at end of file
+    list_filter = (('tenant', admin.RelatedOnlyFieldListFilter), 'is_primary')
+    search_fields = ('domain',)
+    autocomplete_fields = ('tenant',)
+    list_select_related = ('tenant',)
+
+    def get_queryset(self, request):
+        # Join the tenant up front so list_display doesn't query per row
+        return super().get_queryset(request).select_related('tenant')
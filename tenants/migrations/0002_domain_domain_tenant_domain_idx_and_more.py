@@ -0,0 +1,25 @@
+# Generated by Django 5.0 on 2026-10-14 15:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenants', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='domain',
+            index=models.Index(fields=['tenant', 'domain'], name='domain_tenant_domain_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tenant',
+            index=models.Index(fields=['is_active'], name='tenant_is_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tenant',
+            index=models.Index(fields=['plan', 'is_active'], name='tenant_plan_active_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.0 on 2026-10-14 15:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenants', '0002_domain_domain_tenant_domain_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tenant',
+            index=models.Index(fields=['-created_at'], name='tenant_created_at_desc_idx'),
+        ),
+    ]
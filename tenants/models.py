@@ -1,4 +1,6 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django_tenants.models import TenantMixin, DomainMixin
 
 class Tenant(TenantMixin):
@@ -26,13 +28,37 @@ class Tenant(TenantMixin):
     
     # Required by tenant_schemas
     auto_create_schema = True
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['is_active'], name='tenant_is_active_idx'),
+            models.Index(fields=['plan', 'is_active'], name='tenant_plan_active_idx'),
+            models.Index(fields=['-created_at'], name='tenant_created_at_desc_idx'),
+            # Trigram index matching the admin's icontains search
+            GinIndex(
+                OpClass(Upper('name'), name='gin_trgm_ops'),
+                name='tenant_name_trgm',
+            ),
+        ]
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Derive the schema once on construction so bulk_create,
+        # which bypasses save(), still writes a valid schema_name
+        if self.pk is None and not self.schema_name and self.slug:
+            self.schema_name = self._schema_name_for(self.slug)
+
+    @staticmethod
+    def _schema_name_for(slug):
+        """Build the PostgreSQL schema name for a tenant slug"""
+        # PostgreSQL schema names must be valid identifiers
+        # Replace hyphens with underscores
+        return f"tenant_{slug.replace('-', '_')}"
+
     def save(self, *args, **kwargs):
-        """Override save to set schema_name based on slug"""
+        """Override save to set schema_name if slug was assigned after init"""
         if not self.schema_name:
-            # PostgreSQL schema names must be valid identifiers
-            # Replace hyphens with underscores
-            self.schema_name = f"tenant_{self.slug.replace('-', '_')}"
+            self.schema_name = self._schema_name_for(self.slug)
         super().save(*args, **kwargs)
     
     def __str__(self):
@@ -42,4 +68,11 @@ class Domain(DomainMixin):
     """
     Represents a domain for a tenant.
     """
-    pass
+    class Meta:
+        indexes = [
+            models.Index(fields=['tenant', 'domain'], name='domain_tenant_domain_idx'),
+            GinIndex(
+                OpClass(Upper('domain'), name='gin_trgm_ops'),
+                name='domain_domain_trgm',
+            ),
+        ]